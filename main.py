@@ -5,14 +5,30 @@ import os
 import csv
 import threading
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Callable, ValuesView
+from dataclasses import dataclass, field, fields, replace
 import uuid
 import sys
 import logging
-from queue import Queue
+from collections import deque
 import shutil
 import re
+import select
+import heapq
+import bisect
+import atexit
+from functools import lru_cache
+from contextlib import contextmanager
+
+try:
+    import orjson  # Optional: much faster JSON encode/decode
+except ImportError:
+    orjson = None
+
+try:
+    import msvcrt  # Windows console, where select() only accepts sockets
+except ImportError:
+    msvcrt = None
 
 # Configure logging
 logging.basicConfig(filename='task_manager.log', level=logging.INFO,
@@ -26,10 +42,99 @@ BLUE = "\033[94m"
 CYAN = "\033[96m"
 MAGENTA = "\033[95m"
 RESET = "\033[0m"
+CLEAR_SCREEN = "\033[H\033[2J\033[3J"  # Home, erase display and scrollback, like `clear`, without spawning a shell
+CURSOR_HOME = "\033[H"  # Home only: animation frames overwrite the previous one instead of blanking the screen
+
+def _enable_vt_mode():
+    # Windows consoles only interpret ANSI escapes once virtual terminal processing is switched on
+    import ctypes
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+    mode = ctypes.c_uint32()
+    if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        kernel32.SetConsoleMode(handle, mode.value | 0x0004)  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+
+if os.name == "nt":
+    _enable_vt_mode()
+
+WAVE_CELLS = [f"{color}#{RESET}".encode() for color in (CYAN, MAGENTA, BLUE)]  # Pre-encoded idle wave cells
+
+BACKUP_SLOTS = 5  # Backups rotate through backup_users_0..4.json / backup_tasks_0..4.json
+
+NOTIFY_MAX_SLEEP = 86400.0  # Longest the notifier sleeps between heap checks, in seconds
+IDLE_TIMEOUT = 15  # Seconds without input at the menu before the idle animation starts
+MILESTONES = [50, 100, 250, 500, 1000]  # Point thresholds that trigger a celebration, ascending
+
+# Only the message changes between shoutouts
+SHOUTOUT_TEMPLATE = (MAGENTA + "🎉 {message} 🎉\n" +
+                     MAGENTA + ' .-""""""""-.\n'
+                     ": ,  👥  , :\n"
+                     ": ,______ , :\n"
+                     " `._      _.'" + RESET)
+
+# Box borders shared by the menu and the animated header
+HEADER_TOP = f"{RED}╔════════════════════════════════════════════╗{RESET}"
+HEADER_DIVIDER = f"{RED}╠════════════════════════════════════════════╣{RESET}"
+HEADER_TAGLINE = f"{RED}║ {CYAN}Efficient. Organized. Productive.{RESET} {RED}║{RESET}"
+HEADER_BOTTOM = f"{RED}╚════════════════════════════════════════════╝{RESET}"
+
+# Task list row pieces, built once instead of per rendered row
+TASKS_TOP = f"{BLUE}┌{'─' * 80}┐{RESET}"
+TASKS_BOTTOM = f"{BLUE}└{'─' * 80}┘{RESET}"
+PROGRESS_BARS = [f"{CYAN}[{'█' * i}{' ' * (20 - i)}]" for i in range(21)]  # Indexed by progress // 5
+STATUS_DONE = f"{GREEN}✓{RESET}"
+STATUS_OPEN = f"{RED}✗{RESET}"
+
+# Markdown patterns for task descriptions, compiled once
+MD_BOLD = re.compile(r'\*\*(.*?)\*\*')
+MD_ITALIC = re.compile(r'\*(.*?)\*')
+MD_HEADER = re.compile(r'^#\s(.*?)$', re.MULTILINE)
+
+def _clear_screen():
+    sys.stdout.write(CLEAR_SCREEN)
+    sys.stdout.flush()
+
+def _prompt(message: str, timeout: Optional[float] = None) -> Optional[str]:
+    # Prompt used by the menu loops: writes the prompt, flushes once and reads a raw line from sys.stdin
+    # (no line editing; readline is not loaded). With a timeout, returns None if nothing was typed in time.
+    sys.stdout.write(message)
+    sys.stdout.flush()
+    if timeout is not None and not _input_waiting(timeout):
+        return None
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+def _input_waiting(timeout: float = 0) -> bool:
+    # Waits at most timeout seconds for stdin to have input; 0 makes it a non-blocking check
+    if msvcrt is not None:
+        deadline = time.time() + timeout
+        while not msvcrt.kbhit():
+            if time.time() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+    return bool(select.select([sys.stdin], [], [], timeout)[0])
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    # Due dates repeat across tasks and views; parse each distinct string once
+    return datetime.fromisoformat(value)
+
+def _json_dumps(obj, indent: bool = True) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2) if indent else orjson.dumps(obj)
+    return json.dumps(obj, indent=2 if indent else None).encode()
 
-@dataclass
+def _json_loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+@dataclass(slots=True)
 class Task:
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
     title: str = ""
     description: str = ""  # Now supports Markdown
     priority: str = "low"
@@ -41,35 +146,132 @@ class Task:
     effort_hours: float = 1.0
     dependencies: List[str] = field(default_factory=list)
     recurring: str = "none"  # 'daily', 'weekly', 'none'
-
-@dataclass
+    # Parsed due date cache; due_date stays the ISO string that is stored and displayed
+    _due_key: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _due_ts: float = field(default=0.0, init=False, repr=False, compare=False)
+    # Case-folded title/description cache for keyword search
+    _text_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _text_cf: str = field(default="", init=False, repr=False, compare=False)
+
+    @property
+    def due_ts(self) -> float:
+        # Unix timestamp of due_date, re-parsed only when the string changes
+        if self._due_key != self.due_date:
+            self._due_ts = _parse_iso(self.due_date).timestamp()
+            self._due_key = self.due_date
+        return self._due_ts
+
+    @property
+    def search_text(self) -> str:
+        # Title and description case-folded together, rebuilt only when either one changes
+        key = (self.title, self.description)
+        if self._text_key != key:
+            self._text_cf = f"{self.title}\n{self.description}".casefold()
+            self._text_key = key
+        return self._text_cf
+
+TASK_FIELDS = [f.name for f in fields(Task) if f.init]  # Persisted fields, excluding caches
+
+def _task_dict(task: Task) -> Dict:
+    return {name: getattr(task, name) for name in TASK_FIELDS}
+
+@dataclass(slots=True)
 class User:
     username: str
     password_hash: str  # Use proper hashing in production
-    tasks: List[Task] = field(default_factory=list)
+    tasks: Dict[str, Task] = field(default_factory=dict)  # Keyed by task ID, in insertion order
     points: int = 0  # For gamification
     avatar: str = ""  # Custom ASCII avatar
     milestone_history: List[Dict] = field(default_factory=list)  # Track milestones and task points
 
 class TaskManager:
     def __init__(self):
+        self.journal_file = "users_journal.jsonl"  # Append-only log of changes since the last full save
+        self._dirty = False  # Set by mutations, cleared once changes are flushed to disk
+        self._journal_buffer: Optional[List[bytes]] = None  # Collects journal lines inside buffered()
+        self._notify_wakeup = threading.Event()  # Set on mutations so the notifier recomputes its sleep
+        self._user_blob_cache: Dict[str, Optional[bytes]] = {}  # Encoded users; None once modified
         self.users = self._load_users()
         self.current_user = self._authenticate()
+        self._milestones_reached = {m["milestone"] for m in self.current_user.milestone_history if "milestone" in m}
+        self._due_lock = threading.Lock()
+        self._due_heap: List[tuple] = []  # (warning timestamp, task ID, due date), soonest first
+        for task in self.current_user.tasks.values():
+            self._schedule_warning(task)
+        self._recurring_ids = {t.id for t in self.current_user.tasks.values() if t.recurring != "none"}
+        self._next_recur_check_ts = 0.0  # Earliest time the recurring sweep can find work; 0 forces a check
         self.undo_stack = []
-        self.notification_queue = Queue()
-        self.categories = set(t.category for t in self.current_user.tasks)
+        self.notification_queue = deque()  # Filled by the notifier thread; append/popleft are atomic
+        self._notify_pending = threading.Event()  # Set whenever a notification is queued
+        self.categories = set(t.category for t in self.current_user.tasks.values())
         self.shared_tasks_file = "shared_tasks.json"  # Collaborative mode file
         self.cloud_tasks_file = "cloud_tasks.json"  # Simulated local cloud sync file
         self.version = "2.9"
+        # Menu choices map straight to handlers; "19" (Exit) is handled by run() itself
+        self._dispatch: Dict[str, Callable[[], None]] = {
+            "1": self.add_task,
+            "2": self.edit_task,
+            "3": self.delete_task,
+            "4": self.undo_delete,
+            "5": self.toggle_complete,
+            "6": self.filter_tasks,
+            # Commented out Sort Tasks
+            # "7": self.sort_tasks,
+            "7": self.search_tasks,
+            "8": self.export_tasks,
+            "9": self.import_tasks,
+            "10": self.show_dashboard,
+            "11": self.manage_categories,
+            "12": self.browse_tasks,
+            "13": self.set_avatar,
+            "14": self.team_shoutout,
+            "15": self.sync_cloud,
+            "16": self.check_milestones,
+            "17": self.show_analytics,
+            "18": self.backup_data,
+        }
+        # The menu never changes during a session, so the whole frame (clear included) is encoded once
+        self._menu_frame = (CLEAR_SCREEN + "\n".join([
+            HEADER_TOP,
+            f"{RED}║    {YELLOW}ADVANCED TASK MANAGER CLI v{self.version}{RESET}    {RED}║{RESET}",
+            HEADER_DIVIDER,
+            HEADER_TAGLINE,
+            HEADER_BOTTOM,
+            f"{BLUE}1. Add Task{RESET}",
+            f"{BLUE}2. Edit Task{RESET}",
+            f"{BLUE}3. Delete Task{RESET}",
+            f"{BLUE}4. Undo Delete{RESET}",
+            f"{BLUE}5. Toggle Completion{RESET}",
+            f"{BLUE}6. Filter Tasks{RESET}",
+            # Commented out Sort Tasks
+            # f"{BLUE}7. Sort Tasks{RESET}",
+            f"{BLUE}7. Search Tasks{RESET}",
+            f"{BLUE}8. Export Tasks{RESET}",
+            f"{BLUE}9. Import Tasks{RESET}",
+            f"{BLUE}10. Show Dashboard{RESET}",
+            f"{BLUE}11. Manage Categories{RESET}",
+            f"{BLUE}12. Display All Tasks{RESET}",
+            f"{BLUE}13. Set Avatar{RESET}",
+            f"{BLUE}14. Team Shoutout{RESET}",
+            f"{BLUE}15. Sync with Cloud{RESET}",
+            f"{BLUE}16. Check Milestones{RESET}",
+            f"{BLUE}17. Show Analytics{RESET}",
+            f"{BLUE}18. Backup Data{RESET}",
+            f"{BLUE}19. Exit{RESET}",
+        ]) + "\n").encode(sys.stdout.encoding or "utf-8", errors="replace")
+        atexit.register(self._flush)
 
     def _load_users(self) -> Dict[str, User]:
         try:
             if os.path.exists("users.json"):
-                with open("users.json", "r") as f:
-                    data = json.load(f)
-                    return {u["username"]: User(u["username"], u["password_hash"], [Task(**task) for task in u.get("tasks", [])], u.get("points", 0), u.get("avatar", ""), u.get("milestone_history", [])) for u in data}
+                with open("users.json", "rb") as f:
+                    data = _json_loads(f.read())
+                    self._user_blob_cache = {u["username"]: _json_dumps(u) for u in data}
+                    users = {u["username"]: User(u["username"], u["password_hash"], {task["id"]: Task(**task) for task in u.get("tasks", [])}, u.get("points", 0), u.get("avatar", ""), u.get("milestone_history", [])) for u in data}
             else:
-                return {"default": User("default", "default123")}
+                users = {"default": User("default", "default123")}
+            self._replay_journal(users)
+            return users
         except json.JSONDecodeError as e:
             logging.error(f"Error decoding users.json: {e}")
             return {"default": User("default", "default123")}
@@ -77,26 +279,165 @@ class TaskManager:
             logging.error(f"Error loading users: {e}")
             return {"default": User("default", "default123")}
 
+    def _replay_journal(self, users: Dict[str, User]):
+        # Re-apply changes that were logged after the last full save (e.g. the app was killed)
+        if not os.path.exists(self.journal_file):
+            return
+        touched = set()
+        with open(self.journal_file, "rb") as f:
+            for line in f:
+                try:
+                    entry = _json_loads(line)
+                except ValueError:
+                    logging.error(f"Skipping corrupt journal entry: {line[:80]!r}")
+                    continue
+                user = users.get(entry["user"])
+                if user is None:
+                    continue
+                touched.add(user.username)
+                if entry["op"] == "put":
+                    task = Task(**entry["task"])
+                    user.tasks[task.id] = task
+                elif entry["op"] == "delete":
+                    user.tasks.pop(entry["id"], None)
+                elif entry["op"] == "user":
+                    user.points = entry["points"]
+                    user.avatar = entry["avatar"]
+                    if "milestone_history" in entry:  # Journals written before history was logged per entry
+                        user.milestone_history = entry["milestone_history"]
+                elif entry["op"] == "milestone":
+                    user.milestone_history.append(entry["entry"])
+        for username in touched:
+            self._user_blob_cache[username] = None
+        self._dirty = bool(touched)
+
+    def _serialize_user(self, u: User) -> bytes:
+        return _json_dumps({"username": u.username, "password_hash": u.password_hash, "tasks": [_task_dict(t) for t in u.tasks.values()], "points": u.points, "avatar": u.avatar, "milestone_history": u.milestone_history})
+
     def _save_users(self):
         try:
-            with open("users.json", "w") as f:
-                json.dump([{"username": u.username, "password_hash": u.password_hash, "tasks": [vars(t) for t in u.tasks], "points": u.points, "avatar": u.avatar, "milestone_history": u.milestone_history} for u in self.users.values()], f, indent=2)
-            shutil.copy("users.json", f"backup_users_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+            blobs = []
+            for u in self.users.values():
+                blob = self._user_blob_cache.get(u.username)
+                if blob is None:
+                    blob = self._user_blob_cache[u.username] = self._serialize_user(u)
+                blobs.append(blob)
+            # Write beside the store and swap it in, so a crash mid-write never leaves a truncated users.json
+            with open("users.json.tmp", "wb") as f:
+                f.write(b"[\n" + b",\n".join(blobs) + b"\n]")
+            os.replace("users.json.tmp", "users.json")
+            return True
         except Exception as e:
             logging.error(f"Error saving users: {e}")
+            return False
+
+    def _load_tasks(self) -> ValuesView[Task]:
+        return self.current_user.tasks.values()
 
-    def _load_tasks(self) -> List[Task]:
-        return self.current_user.tasks
+    def _mark_dirty(self):
+        self._dirty = True
+        self._notify_wakeup.set()
+        self._user_blob_cache[self.current_user.username] = None
+
+    def _append_journal(self, entry: Dict):
+        line = _json_dumps(entry, indent=False) + b"\n"
+        if self._journal_buffer is not None:
+            self._journal_buffer.append(line)
+        else:
+            self._write_journal([line])
+
+    def _write_journal(self, lines: List[bytes]):
+        try:
+            with open(self.journal_file, "ab") as f:
+                f.write(b"".join(lines))
+        except Exception as e:
+            logging.error(f"Error writing journal: {e}")
+
+    @contextmanager
+    def buffered(self):
+        # Bulk changes (imports, syncs) append all their journal lines in one write at the end
+        self._journal_buffer = []
+        try:
+            yield
+        finally:
+            lines, self._journal_buffer = self._journal_buffer, None
+            if lines:
+                self._write_journal(lines)
+
+    def _schedule_warning(self, task: Task):
+        # Entries are never removed eagerly; the notifier drops stale ones when they reach the top
+        if task.completed:
+            return
+        try:
+            warn_ts = task.due_ts - 3600
+        except (ValueError, OverflowError, OSError):
+            return  # Unparseable or unrepresentable due date: nothing to warn about
+        # Far-future entries are kept as-is; they just sit at the bottom of the heap. The notifier never
+        # sleeps longer than NOTIFY_MAX_SLEEP, so even a head entry years away cannot overflow its wait
+        with self._due_lock:
+            heapq.heappush(self._due_heap, (warn_ts, task.id, task.due_date))
+
+    def _log_task(self, task: Task):
+        self._schedule_warning(task)
+        self.categories.add(task.category)  # New or edited categories show up without rescanning tasks
+        if task.recurring != "none":
+            self._recurring_ids.add(task.id)
+        self._next_recur_check_ts = 0.0
+        self._mark_dirty()
+        self._append_journal({"op": "put", "user": self.current_user.username, "task": _task_dict(task)})
+
+    def _log_delete(self, task_id: str):
+        self._mark_dirty()
+        self._append_journal({"op": "delete", "user": self.current_user.username, "id": task_id})
+
+    def _log_user(self, new_history: Optional[List[Dict]] = None):
+        # History only grows, so just the entries added since the last call are journaled, not the whole list
+        u = self.current_user
+        self._mark_dirty()
+        self._append_journal({"op": "user", "user": u.username, "points": u.points, "avatar": u.avatar})
+        for entry in new_history or ():
+            self._append_journal({"op": "milestone", "user": u.username, "entry": entry})
+
+    def _flush(self):
+        # Persist pending changes once instead of rewriting everything on every mutation
+        if self._dirty:
+            if self._save_tasks():
+                self._dirty = False
 
     def _save_tasks(self):
-        self._save_users()
-        self._backup_tasks()
         self._sync_shared_tasks()  # Sync with shared file
+        if not self._save_users():
+            return False
+        # The snapshot now contains everything the journal recorded
+        if os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
+        return True
+
+    def _next_backup_slot(self) -> int:
+        # Overwrite a missing or the oldest slot, so backups stay bounded at BACKUP_SLOTS files each
+        def written_at(slot):
+            # A slot is as old as the older file of its pair; a missing file makes it free
+            paths = (f"backup_users_{slot}.json", f"backup_tasks_{slot}.json")
+            return min(os.path.getmtime(p) if os.path.exists(p) else -1.0 for p in paths)
+        return min(range(BACKUP_SLOTS), key=written_at)
+
+    def _backup(self):
+        slot = self._next_backup_slot()
+        try:
+            # Both files of a slot always come from the same backup
+            if os.path.exists("users.json"):
+                shutil.copy("users.json", f"backup_users_{slot}.json")
+            elif os.path.exists(f"backup_users_{slot}.json"):
+                os.remove(f"backup_users_{slot}.json")  # Stale copy from an earlier rotation
+            self._backup_tasks(slot)
+        except Exception as e:
+            logging.error(f"Error creating backup: {e}")
 
-    def _backup_tasks(self):
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        with open(f"backup_tasks_{timestamp}.json", "w") as f:
-            json.dump([vars(t) for t in self.current_user.tasks], f, indent=2)
+    def _backup_tasks(self, slot: int):
+        # Encode once and hand the kernel a single buffer; backups are not meant to be read by hand
+        payload = _json_dumps([_task_dict(t) for t in self.current_user.tasks.values()], indent=False)
+        with open(f"backup_tasks_{slot}.json", "wb") as f:
+            f.write(payload)
 
     def _authenticate(self) -> User:
         username = input(f"{YELLOW}Enter username: {RESET}")
@@ -107,41 +448,46 @@ class TaskManager:
         print(f"{RED}Invalid credentials. Using default user.{RESET}")
         return self.users.get("default", User("default", "default123"))
 
+    def _merge_tasks(self, incoming: List[Task]) -> List[Task]:
+        # Incoming tasks win on ID clashes; returns only the ones that actually changed
+        changed = [t for t in incoming if self.current_user.tasks.get(t.id) != t]
+        if changed:
+            self.current_user.tasks.update((t.id, t) for t in changed)
+        return changed
+
     def _sync_shared_tasks(self):
         if os.path.exists(self.shared_tasks_file):
             try:
-                with open(self.shared_tasks_file, "r") as f:
-                    shared_tasks = [Task(**task) for task in json.load(f)]
-                task_dict = {t.id: t for t in self.current_user.tasks}
-                for task in shared_tasks:
-                    task_dict[task.id] = task
-                self.current_user.tasks = list(task_dict.values())
-                self._save_tasks()
+                with open(self.shared_tasks_file, "rb") as f:
+                    shared_tasks = [Task(**task) for task in _json_loads(f.read())]
+                with self.buffered():
+                    for task in self._merge_tasks(shared_tasks):
+                        self._log_task(task)  # Warning heap, recurrence and categories see merged tasks too
             except Exception as e:
                 logging.error(f"Error syncing shared tasks: {e}")
 
     def _save_shared_tasks(self):
-        with open(self.shared_tasks_file, "w") as f:
-            json.dump([vars(t) for t in self.current_user.tasks], f, indent=2)
+        payload = _json_dumps([_task_dict(t) for t in self.current_user.tasks.values()])
+        with open(self.shared_tasks_file, "wb") as f:
+            f.write(payload)
 
     def _sync_cloud_tasks(self):
         if os.path.exists(self.cloud_tasks_file):
             try:
-                with open(self.cloud_tasks_file, "r") as f:
-                    cloud_tasks = [Task(**task) for task in json.load(f)]
-                task_dict = {t.id: t for t in self.current_user.tasks}
-                for task in cloud_tasks:
-                    task_dict[task.id] = task
-                self.current_user.tasks = list(task_dict.values())
-                self._save_tasks()
+                with open(self.cloud_tasks_file, "rb") as f:
+                    cloud_tasks = [Task(**task) for task in _json_loads(f.read())]
+                with self.buffered():
+                    for task in self._merge_tasks(cloud_tasks):
+                        self._log_task(task)
             except Exception as e:
                 logging.error(f"Error syncing cloud tasks: {e}")
         else:
             self._save_cloud_tasks()
 
     def _save_cloud_tasks(self):
-        with open(self.cloud_tasks_file, "w") as f:
-            json.dump([vars(t) for t in self.current_user.tasks], f, indent=2)
+        payload = _json_dumps([_task_dict(t) for t in self.current_user.tasks.values()])
+        with open(self.cloud_tasks_file, "wb") as f:
+            f.write(payload)
 
     # Placeholder for future API sync (kept in standby)
     # def _sync_with_api(self):
@@ -151,33 +497,40 @@ class TaskManager:
 
     def _render_markdown(self, text):
         # Basic Markdown rendering: bold (**text**), italics (*text*), headers (# text)
-        text = re.sub(r'\*\*(.*?)\*\*', f"{CYAN}\\1{RESET}", text)  # Bold
-        text = re.sub(r'\*(.*?)\*', f"{MAGENTA}\\1{RESET}", text)  # Italics
-        text = re.sub(r'^#\s(.*?)$', f"{YELLOW}\\1{RESET}", text, flags=re.MULTILINE)  # Header
+        if "*" not in text and "#" not in text:
+            return text  # Plain text, nothing to render
+        text = MD_BOLD.sub(f"{CYAN}\\1{RESET}", text)  # Bold
+        text = MD_ITALIC.sub(f"{MAGENTA}\\1{RESET}", text)  # Italics
+        text = MD_HEADER.sub(f"{YELLOW}\\1{RESET}", text)  # Header
         return text
 
-    def display_tasks(self, page: int = 1, page_size: int = 5):
-        os.system('cls' if os.name == 'nt' else 'clear')
-        tasks = self._load_tasks()
-        if not tasks:
-            print(f"{YELLOW}No tasks available.{RESET}")
-            return
-        total_pages = (len(tasks) + page_size - 1) // page_size
+    def display_tasks(self, page: int = 1, page_size: int = 5, pred: Callable[[Task], bool] = lambda t: True):
+        _clear_screen()
         start = (page - 1) * page_size
         end = start + page_size
-        paginated_tasks = tasks[start:end]
-        total_tasks = len(tasks)
+        # Filter, count and paginate in one pass; only the visible page is kept
+        paginated_tasks = []
+        total_tasks = 0
+        for task in filter(pred, self._load_tasks()):
+            if start <= total_tasks < end:
+                paginated_tasks.append(task)
+            total_tasks += 1
+        if not total_tasks:
+            print(f"{YELLOW}No tasks available.{RESET}")
+            return
+        total_pages = (total_tasks + page_size - 1) // page_size
 
-        print(f"{BLUE}┌{'─' * 80}┐{RESET}")
-        print(f"{BLUE}│ Total Tasks: {total_tasks:<73}│{RESET}")
+        # Collect the whole table and write it in one call
+        lines = [TASKS_TOP, f"{BLUE}│ Total Tasks: {total_tasks:<73}│{RESET}"]
         for task in paginated_tasks:
-            status = f"{GREEN}✓{RESET}" if task.completed else f"{RED}✗{RESET}"
-            progress_bar = f"{CYAN}[{'█' * (task.progress // 5)}{' ' * (20 - task.progress // 5)}] {task.progress}%{RESET}"
+            status = STATUS_DONE if task.completed else STATUS_OPEN
+            progress_bar = f"{PROGRESS_BARS[min(max(task.progress // 5, 0), 20)]} {task.progress}%{RESET}"
             rendered_desc = self._render_markdown(task.description[:20]) if task.description else "No description"
-            print(f"{BLUE}│ [{status}] {task.title[:25]:<25} | {task.priority[:10]:<10} | {task.due_date[:10]:<10} | {progress_bar:<22} | ID: {task.id} │{RESET}")
-            print(f"{BLUE}│ Description: {rendered_desc:<65}│{RESET}")
-        print(f"{BLUE}└{'─' * 80}┘{RESET}")
-        print(f"{YELLOW}Page {page}/{total_pages} (p=prev, n=next, d=details, q=quit){RESET}")
+            lines.append(f"{BLUE}│ [{status}] {task.title[:25]:<25} | {task.priority[:10]:<10} | {task.due_date[:10]:<10} | {progress_bar:<22} | ID: {task.id} │{RESET}")
+            lines.append(f"{BLUE}│ Description: {rendered_desc:<65}│{RESET}")
+        lines.append(TASKS_BOTTOM)
+        lines.append(f"{YELLOW}Page {page}/{total_pages} (p=prev, n=next, d=details, q=quit){RESET}\n")
+        sys.stdout.write("\n".join(lines))
 
     def add_task(self):
         print(f"{GREEN}Selected: Add Task{RESET}")
@@ -199,14 +552,14 @@ class TaskManager:
                 "category": category,
                 "progress": int(input(f"{YELLOW}Enter progress (0-100): {RESET}") or 0),
                 "effort_hours": float(input(f"{YELLOW}Enter effort hours: {RESET}") or 1.0),
-                "dependencies": input(f"{YELLOW}Enter dependent task IDs (comma-separated): {RESET}").split(",") if input(f"{YELLOW}Add dependencies? (y/n): {RESET}").lower() == "y" else [],
+                "dependencies": self._ask_dependencies("Add dependencies? (y/n): ", "Enter dependent task IDs (comma-separated): ") or [],
                 "recurring": input(f"{YELLOW}Recur (none/daily/weekly): {RESET}").lower() or "none"
             }
             if not (0 <= task_data["progress"] <= 100 and task_data["priority"] in ["low", "medium", "high"] and task_data["recurring"] in ["none", "daily", "weekly"]):
                 raise ValueError("Invalid input: Check progress, priority, or recurrence.")
             task = Task(**task_data)
-            self.current_user.tasks.append(task)
-            self._save_tasks()
+            self.current_user.tasks[task.id] = task
+            self._log_task(task)
             print(f"{GREEN}Task created successfully!{RESET}")
 
             # AI Suggestion for the entire task
@@ -220,10 +573,11 @@ class TaskManager:
                     task.due_date = input(f"{YELLOW}Enter new due date ({suggested_task['due_date']}): {RESET}") or suggested_task['due_date']
                     task.progress = int(input(f"{YELLOW}Enter new progress ({suggested_task['progress']}): {RESET}") or suggested_task['progress'])
                     task.effort_hours = float(input(f"{YELLOW}Enter new effort hours ({task.effort_hours}): {RESET}") or task.effort_hours)
-                    if input(f"{YELLOW}Update dependencies? (y/n): {RESET}").lower() == "y":
-                        task.dependencies = input(f"{YELLOW}Enter new dependent task IDs: {RESET}").split(",")
+                    dependencies = self._ask_dependencies("Update dependencies? (y/n): ", "Enter new dependent task IDs: ")
+                    if dependencies is not None:
+                        task.dependencies = dependencies
                     task.recurring = input(f"{YELLOW}Enter new recurrence ({task.recurring}): {RESET}") or task.recurring
-                    self._save_tasks()
+                    self._log_task(task)
                     print(f"{GREEN}Task updated with AI suggestions!{RESET}")
                 except ValueError as e:
                     print(f"{RED}Error: Invalid input. {e}{RESET}")
@@ -234,7 +588,13 @@ class TaskManager:
         except ValueError as e:
             print(f"{RED}Error: {e}{RESET}")
         input(f"{YELLOW}Press Enter to continue...{RESET}")
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear_screen()
+
+    def _ask_dependencies(self, question: str, prompt: str) -> Optional[List[str]]:
+        # Ask once, then read the IDs only on "y"; None means the user declined
+        if input(f"{YELLOW}{question}{RESET}").lower() != "y":
+            return None
+        return [dep.strip() for dep in input(f"{YELLOW}{prompt}{RESET}").split(",") if dep.strip()]
 
     def _suggest_title(self, category):
         # Simple AI-like suggestion based on category
@@ -273,7 +633,7 @@ class TaskManager:
         print(f"{GREEN}Selected: Edit Task{RESET}")
         self.display_tasks()
         task_id = input(f"{YELLOW}Enter task ID to edit: {RESET}")
-        task = next((t for t in self.current_user.tasks if t.id == task_id), None)
+        task = self.current_user.tasks.get(task_id)
         if task:
             try:
                 task.title = input(f"{YELLOW}Enter new title ({task.title}): {RESET}") or task.title
@@ -283,80 +643,90 @@ class TaskManager:
                 task.category = input(f"{YELLOW}Enter new category ({task.category}): {RESET}") or task.category
                 task.progress = int(input(f"{YELLOW}Enter new progress ({task.progress}): {RESET}") or task.progress)
                 task.effort_hours = float(input(f"{YELLOW}Enter new effort hours ({task.effort_hours}): {RESET}") or task.effort_hours)
-                if input(f"{YELLOW}Update dependencies? (y/n): {RESET}").lower() == "y":
-                    task.dependencies = input(f"{YELLOW}Enter new dependent task IDs: {RESET}").split(",")
+                dependencies = self._ask_dependencies("Update dependencies? (y/n): ", "Enter new dependent task IDs: ")
+                if dependencies is not None:
+                    task.dependencies = dependencies
                 task.recurring = input(f"{YELLOW}Enter new recurrence ({task.recurring}): {RESET}") or task.recurring
-                self._save_tasks()
+                self._log_task(task)
                 print(f"{GREEN}Task updated successfully!{RESET}")
             except ValueError as e:
                 print(f"{RED}Error: Invalid input. {e}{RESET}")
         else:
             print(f"{RED}Task not found.{RESET}")
         input(f"{YELLOW}Press Enter to continue...{RESET}")
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear_screen()
 
     def delete_task(self):
         print(f"{GREEN}Selected: Delete Task{RESET}")
         self.display_tasks()
         task_id = input(f"{YELLOW}Enter task ID to delete: {RESET}")
-        task_to_delete = next((t for t in self.current_user.tasks if t.id == task_id), None)
+        task_to_delete = self.current_user.tasks.pop(task_id, None)
         if task_to_delete:
             self.undo_stack.append(task_to_delete)
-            self.current_user.tasks[:] = [t for t in self.current_user.tasks if t.id != task_id]
-            self._save_tasks()
+            self._log_delete(task_id)
             print(f"{GREEN}Task deleted successfully! Undo available.{RESET}")
         else:
             print(f"{RED}Task not found.{RESET}")
         input(f"{YELLOW}Press Enter to continue...{RESET}")
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear_screen()
 
     def undo_delete(self):
         if self.undo_stack:
             task = self.undo_stack.pop()
-            self.current_user.tasks.append(task)
-            self._save_tasks()
+            self.current_user.tasks[task.id] = task
+            self._log_task(task)
             print(f"{GREEN}Last deletion undone!{RESET}")
         else:
             print(f"{YELLOW}No actions to undo.{RESET}")
         input(f"{YELLOW}Press Enter to continue...{RESET}")
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear_screen()
 
     def toggle_complete(self):
         print(f"{GREEN}Selected: Toggle Completion{RESET}")
         self.display_tasks()
         task_id = input(f"{YELLOW}Enter task ID to toggle: {RESET}")
-        task = next((t for t in self.current_user.tasks if t.id == task_id), None)
+        task = self.current_user.tasks.get(task_id)
         if task:
             task.completed = not task.completed
             if task.completed:
-                points_earned = self._calculate_points(task)
+                now = datetime.now()
+                achieved_at = now.isoformat()
+                achieved_at_display = achieved_at[:19]  # Sliced once here instead of on every help render
+                points_earned = self._calculate_points(task, now)
+                history_start = len(self.current_user.milestone_history)
                 self.current_user.points += points_earned
                 self.current_user.milestone_history.append({
                     "task_id": task.id,
                     "title": task.title,
                     "points": points_earned,
-                    "achieved_at": datetime.now().isoformat(),
+                    "achieved_at": achieved_at,
+                    "achieved_at_display": achieved_at_display,
                     "priority_bonus": 5 if task.priority == "high" else 0,
-                    "timeliness_bonus": 5 if datetime.now() <= datetime.fromisoformat(task.due_date) else 0
+                    "timeliness_bonus": 5 if now.timestamp() <= task.due_ts else 0
                 })
-                if self.current_user.points >= 50 and not any(m["points"] == 50 for m in self.current_user.milestone_history if "milestone" in m):
-                    self.current_user.milestone_history.append({"milestone": 50, "achieved_at": datetime.now().isoformat()})
-                    self._show_milestone()
-            self._save_tasks()
+                reached = MILESTONES[:bisect.bisect_right(MILESTONES, self.current_user.points)]
+                new_levels = [level for level in reached if level not in self._milestones_reached]
+                for level in new_levels:
+                    self._milestones_reached.add(level)
+                    self.current_user.milestone_history.append({"milestone": level, "achieved_at": achieved_at, "achieved_at_display": achieved_at_display})
+                if new_levels:
+                    self._show_milestone(new_levels[-1])  # Celebrate the highest one when several are crossed at once
+                self._log_user(self.current_user.milestone_history[history_start:])
+            self._log_task(task)
             print(f"{GREEN}Task completion toggled! Points earned: {points_earned if task.completed else 0}{RESET}")
         else:
             print(f"{RED}Task not found.{RESET}")
         input(f"{YELLOW}Press Enter to continue...{RESET}")
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear_screen()
 
-    def _calculate_points(self, task):
+    def _calculate_points(self, task, now: Optional[datetime] = None):
         base_points = 10
         priority_bonus = 5 if task.priority == "high" else 0
-        timeliness_bonus = 5 if datetime.now() <= datetime.fromisoformat(task.due_date) else 0
+        timeliness_bonus = 5 if (now or datetime.now()).timestamp() <= task.due_ts else 0
         return base_points + priority_bonus + timeliness_bonus
 
-    def _show_milestone(self):
-        trophy = f"{GREEN}🏆 Congrats! You've reached 50 points! 🎉{RESET}\n" \
+    def _show_milestone(self, level: int):
+        trophy = f"{GREEN}🏆 Congrats! You've reached {level} points! 🎉{RESET}\n" \
                  f"{GREEN}       .-""""""""-.\n" \
                  f"      .'          '.\n" \
                  f"     : ,          , :\n" \
@@ -366,56 +736,23 @@ class TaskManager:
         print(trophy)
         print(fireworks)
         input(f"{YELLOW}Press Enter to continue...{RESET}")
-        os.system('cls' if os.name == 'nt' else 'clear')
-
-    def check_milestones(self):
-        print(f"{GREEN}Selected: Check Milestones{RESET}")
-        print(f"{CYAN}Current Points: {self.current_user.points}{RESET}")
-        if self.current_user.points >= 50:
-            self._show_milestone()
-        else:
-            print(f"{YELLOW}Keep going! Need {50 - self.current_user.points} more points for the next milestone!{RESET}")
-
-        while True:
-            action = input(f"{YELLOW}Press 'h' for help on milestones, or Enter to exit: {RESET}").lower()
-            if action == "h":
-                self._show_milestone_help()
-            elif not action:  # Enter key
-                break
-            else:
-                print(f"{RED}Invalid input. Use 'h' or Enter.{RESET}")
-        os.system('cls' if os.name == 'nt' else 'clear')
-
-    def _show_milestone_help(self):
-        print(f"{GREEN}=== Milestone Help ==={RESET}")
-        print(f"{CYAN}Current Points: {self.current_user.points}{RESET}")
-        if self.current_user.milestone_history:
-            print(f"{CYAN}Milestone History & Reward Details:{RESET}")
-            for entry in self.current_user.milestone_history:
-                if "task_id" in entry:
-                    print(f"- Task: {entry['title']} (ID: {entry['task_id']})")
-                    print(f"  - Base Points: 10")
-                    print(f"  - Priority Bonus: {entry['priority_bonus']} (High priority adds 5){RESET}")
-                    print(f"  - Timeliness Bonus: {entry['timeliness_bonus']} (On-time adds 5){RESET}")
-                    print(f"  - Total Points: {entry['points']} (Earned on {entry['achieved_at'][:19]}){RESET}")
-                elif "milestone" in entry:
-                    print(f"- Milestone Reached: {entry['milestone']} points on {entry['achieved_at'][:19]}{RESET}")
-        else:
-            print(f"{YELLOW}No milestones or task completions yet.{RESET}")
-        print(f"{CYAN}Reward System:{RESET}")
-        print(f"- Base Points: 10 per completed task{RESET}")
-        print(f"- Priority Bonus: +5 for high-priority tasks{RESET}")
-        print(f"- Timeliness Bonus: +5 if completed on or before due date{RESET}")
-        print(f"{CYAN}Next Milestone: 50 points (triggers celebration!){RESET}")
-        input(f"{YELLOW}Press Enter to continue...{RESET}")
+        _clear_screen()
 
     def filter_tasks(self):
         print(f"{GREEN}Selected: Filter Tasks{RESET}")
         category = input(f"{YELLOW}Enter category: {RESET}")
-        filtered = [t for t in self.current_user.tasks if category.lower() in t.category.lower()]
-        self.display_tasks(page=1, tasks=filtered)
+        pattern = re.compile(re.escape(category), re.IGNORECASE)  # Compiled once, no per-task lowercasing
+        matched = {}  # Category -> hit; the pattern runs once per distinct category, not once per task
+
+        def pred(t):
+            hit = matched.get(t.category)
+            if hit is None:
+                hit = matched[t.category] = pattern.search(t.category) is not None
+            return hit
+
+        self.display_tasks(page=1, pred=pred)
         input(f"{YELLOW}Press Enter to continue...{RESET}")
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear_screen()
 
     # Commented out Sort Tasks
     # def sort_tasks(self):
@@ -437,57 +774,88 @@ class TaskManager:
         keyword = input(f"{YELLOW}Enter keyword: {RESET}")
         start = input(f"{YELLOW}Start date (YYYY-MM-DD, blank for none): {RESET}")
         end = input(f"{YELLOW}End date (YYYY-MM-DD, blank for none): {RESET}")
-        results = [t for t in self.current_user.tasks if keyword.lower() in t.title.lower() or keyword.lower() in t.description.lower() and
-                   (not start or datetime.fromisoformat(t.due_date) >= datetime.fromisoformat(start)) and
-                   (not end or datetime.fromisoformat(t.due_date) <= datetime.fromisoformat(end))]
-        self.display_tasks(page=1, tasks=results)
+        try:
+            # Parse the bounds once, outside the per-task predicate
+            start_ts = datetime.fromisoformat(start).timestamp() if start else None
+            end_ts = datetime.fromisoformat(end).timestamp() if end else None
+        except ValueError as e:
+            print(f"{RED}Error: {e}{RESET}")
+        else:
+            needle = keyword.casefold()
+
+            def matches(t):
+                # Cheapest checks first; due dates are only compared for keyword hits when a bound is set
+                if needle not in t.search_text:
+                    return False
+                return (start_ts is None or t.due_ts >= start_ts) and (end_ts is None or t.due_ts <= end_ts)
+            self.display_tasks(page=1, pred=matches)
         input(f"{YELLOW}Press Enter to continue...{RESET}")
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear_screen()
 
     def export_tasks(self):
         print(f"{GREEN}Selected: Export Tasks{RESET}")
-        fmt = input(f"{YELLOW}Format (json/csv): {RESET}").lower()
+        fmt = input(f"{YELLOW}Format (json/jsonl/csv): {RESET}").lower()
         filename = input(f"{YELLOW}Enter filename: {RESET}") or f"tasks_{datetime.now().strftime('%Y%m%d')}"
-        tasks = [vars(t) for t in self.current_user.tasks]
         if fmt == "csv":
             with open(f"{filename}.csv", "w", newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=tasks[0].keys())
-                writer.writeheader()
-                writer.writerows(tasks)
+                # Rows are generated on the fly; no per-task dicts are built
+                writer = csv.writer(f)
+                writer.writerow(TASK_FIELDS)
+                writer.writerows([getattr(t, k) for k in TASK_FIELDS] for t in self.current_user.tasks.values())
+        elif fmt == "jsonl":
+            with open(f"{filename}.jsonl", "wb") as f:
+                # One task per line, encoded as it is written instead of building the whole document
+                f.writelines(_json_dumps(_task_dict(t), indent=False) + b"\n" for t in self.current_user.tasks.values())
         else:
-            with open(f"{filename}.json", "w") as f:
-                json.dump(tasks, f, indent=2)
+            payload = _json_dumps([_task_dict(t) for t in self.current_user.tasks.values()])
+            with open(f"{filename}.json", "wb") as f:
+                f.write(payload)
         print(f"{GREEN}Exported to {filename}.{fmt}{RESET}")
         input(f"{YELLOW}Press Enter to continue...{RESET}")
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear_screen()
 
     def import_tasks(self):
         print(f"{GREEN}Selected: Import Tasks{RESET}")
-        filename = input(f"{YELLOW}Enter filename (.json/.csv): {RESET}")
+        filename = input(f"{YELLOW}Enter filename (.json/.jsonl/.csv): {RESET}")
         if filename.endswith(".csv"):
             with open(filename, "r") as f:
                 reader = csv.DictReader(f)
-                self.current_user.tasks.extend([Task(**{k: v for k, v in row.items() if k in Task.__dataclass_fields__}) for row in reader])
+                imported = [Task(**{k: v for k, v in row.items() if k in TASK_FIELDS}) for row in reader]
         elif filename.endswith(".json"):
-            with open(filename, "r") as f:
-                self.current_user.tasks.extend([Task(**data) for data in json.load(f)])
-        self._save_tasks()
+            with open(filename, "rb") as f:
+                imported = [Task(**data) for data in _json_loads(f.read())]
+        elif filename.endswith(".jsonl"):
+            with open(filename, "rb") as f:
+                imported = [Task(**_json_loads(line)) for line in f if line.strip()]
+        else:
+            imported = []
+        self.current_user.tasks.update((t.id, t) for t in imported)
+        with self.buffered():
+            for task in imported:
+                self._log_task(task)
         print(f"{GREEN}Imported from {filename}{RESET}")
         input(f"{YELLOW}Press Enter to continue...{RESET}")
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear_screen()
 
     def show_dashboard(self):
         print(f"{GREEN}Selected: Show Dashboard{RESET}")
         tasks = self._load_tasks()
-        total = len(tasks)
-        completed = sum(1 for t in tasks if t.completed)
-        overdue = sum(1 for t in tasks if not t.completed and datetime.fromisoformat(t.due_date) < datetime.now())
-        high_priority_overdue = sum(1 for t in tasks if t.priority == "high" and not t.completed and datetime.fromisoformat(t.due_date) < datetime.now())
+        now = time.time()
+        total = completed = overdue = high_priority_overdue = 0
+        for t in tasks:  # Single pass over the tasks for every counter
+            total += 1
+            if t.completed:
+                completed += 1
+            elif t.due_ts < now:
+                overdue += 1
+                if t.priority == "high":
+                    high_priority_overdue += 1
+        completion_rate = (completed / total * 100) if total > 0 else 0
         print(f"{CYAN}Total Tasks: {total} | Points: {self.current_user.points}{RESET}")
-        print(f"{CYAN}Completed: {completed} ({completed/total*100:.1f}%) | Avatar: {self.current_user.avatar or 'None'}{RESET}")
+        print(f"{CYAN}Completed: {completed} ({completion_rate:.1f}%) | Avatar: {self.current_user.avatar or 'None'}{RESET}")
         print(f"{CYAN}Overdue: {overdue} (High Priority: {high_priority_overdue}){RESET}")
         input(f"{YELLOW}Press Enter to continue...{RESET}")
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear_screen()
 
     def manage_categories(self):
         print(f"{GREEN}Selected: Manage Categories{RESET}")
@@ -495,107 +863,145 @@ class TaskManager:
         if action == "a":
             new_cat = input(f"{YELLOW}Enter new category: {RESET}")
             self.categories.add(new_cat)
-            self._save_tasks()
+            self._mark_dirty()
             print(f"{GREEN}Category {new_cat} added.{RESET}")
         elif action == "r":
             cat = input(f"{YELLOW}Enter category to remove: {RESET}")
             if cat in self.categories:
                 self.categories.remove(cat)
-                self._save_tasks()
+                self._mark_dirty()
                 print(f"{GREEN}Category {cat} removed.{RESET}")
             else:
                 print(f"{RED}Category not found.{RESET}")
         input(f"{YELLOW}Press Enter to continue...{RESET}")
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear_screen()
 
     def generate_wave_pattern(self, width, height, frame):
         pattern = []
-        colors = [CYAN, MAGENTA, BLUE]
+        quarter = max(width // 4, 1)
+        # The wave height only depends on the column, so compute it once per column instead of once per cell
+        waves = [int(5 + 4 * random.uniform(0.8, 1.2) * (1 + abs(((x + frame) % width - width // 2) / quarter))) for x in range(width)]
         for y in range(height):
-            row = ""
-            for x in range(width):
-                offset = (x + frame) % width
-                wave = int(5 + 4 * random.uniform(0.8, 1.2) * (1 + abs((offset - width // 2) / (width // 4))))
-                char = f"{random.choice(colors)}#{RESET}" if y < wave < y + 1 else " "
-                row += char
-            pattern.append(row)
+            row = bytearray()  # Grows in place instead of copying the row for every cell
+            for wave in waves:
+                row += random.choice(WAVE_CELLS) if wave == y else b" "
+            pattern.append(row.decode())
         return pattern
 
-    def idle_animation(self, last_input_time, queue):
-        width, height = os.get_terminal_size()
+    def idle_animation(self):
+        width, height = shutil.get_terminal_size()
         frame = 0
-        while queue.empty() and time.time() - last_input_time < 15:
-            if sys.stdin.read(1):
-                queue.put(True)
+        _clear_screen()
+        # Animate until a key is pressed or a notification is waiting to be shown
+        while not self.notification_queue:
+            if _input_waiting():
+                sys.stdin.readline()  # The wake-up keypress is not a menu choice
                 break
-            os.system('cls' if os.name == 'nt' else 'clear')
             pattern = self.generate_wave_pattern(width, height, frame)
-            for y, row in enumerate(pattern):
-                if y < height:
-                    print(row[:width])
+            # Rows are already width cells wide; slicing would cut through colour codes
+            sys.stdout.write(CURSOR_HOME + "\n".join(pattern))
+            sys.stdout.flush()
             frame += 1
-            time.sleep(0.1)
-        os.system('cls' if os.name == 'nt' else 'clear')
+            # Frame delay that ends early when a notification arrives
+            if self._notify_pending.wait(0.1) and not self.notification_queue:
+                self._notify_pending.clear()  # Stale wake-up for a message run() already drained
+
+        _clear_screen()
 
     def notify_tasks(self):
+        notified = set()  # (task ID, due date) pairs already announced
         while True:
-            for task in [t for t in self.current_user.tasks if not t.completed]:
-                due = datetime.fromisoformat(task.due_date)
-                if (due - datetime.now()).total_seconds() <= 3600:
-                    self.notification_queue.put(f"{RED}Alert: Task '{task.title}' due in 1 hour!{RESET}")
-            time.sleep(300)
+            self._notify_wakeup.clear()
+            timeout = None
+            with self._due_lock:
+                # Only the head of the heap is inspected; tasks due later are never touched
+                while self._due_heap:
+                    warn_ts, task_id, due_date = self._due_heap[0]
+                    task = self.current_user.tasks.get(task_id)
+                    if task is None or task.completed or task.due_date != due_date or (task_id, due_date) in notified:
+                        heapq.heappop(self._due_heap)  # Deleted, completed, rescheduled or already announced
+                        continue
+                    now = time.time()
+                    if warn_ts > now:
+                        # Capped at a day: a far-future due date (e.g. 9999-12-31) would overflow Event.wait
+                        timeout = min(warn_ts - now, NOTIFY_MAX_SLEEP)
+                        break
+                    heapq.heappop(self._due_heap)
+                    notified.add((task_id, due_date))
+                    self.notification_queue.append(f"{RED}Alert: Task '{task.title}' due in 1 hour!{RESET}")
+                    self._notify_pending.set()
+            # Sleep until the next warning is due, or until a task changes
+            self._notify_wakeup.wait(timeout)
 
     def animated_header(self):
         frames = ["|", "/", "-", "\\"]
+        # Only the spinner changes between frames, so render each variant once up front
+        headers = [CURSOR_HOME + "\n".join([
+                   HEADER_TOP,
+                   f"{RED}║    {YELLOW}ADVANCED TASK MANAGER CLI {CYAN}v{self.version} {frame}{RESET}    {RED}║{RESET}",
+                   HEADER_DIVIDER,
+                   HEADER_TAGLINE,
+                   HEADER_BOTTOM]) + "\n" for frame in frames]
+        _clear_screen()
         for _ in range(5):
-            for frame in frames:
-                os.system('cls' if os.name == 'nt' else 'clear')
-                print(f"{RED}╔════════════════════════════════════════════╗{RESET}")
-                print(f"{RED}║    {YELLOW}ADVANCED TASK MANAGER CLI {CYAN}v{self.version} {frame}{RESET}    {RED}║{RESET}")
-                print(f"{RED}╠════════════════════════════════════════════╣{RESET}")
-                print(f"{RED}║ {CYAN}Efficient. Organized. Productive.{RESET} {RED}║{RESET}")
-                print(f"{RED}╚════════════════════════════════════════════╝{RESET}")
+            for header in headers:
+                sys.stdout.write(header)
                 sys.stdout.flush()
                 time.sleep(0.2)
 
     def loading_screen(self):
-        os.system('cls' if os.name == 'nt' else 'clear')
+        sys.stdout.write(CLEAR_SCREEN + f"{YELLOW}Loading...{RESET}\n")
         bar_length = 50
         for i in range(bar_length + 1):
-            os.system('cls' if os.name == 'nt' else 'clear')
             percentage = (i / bar_length) * 100
             filled = int(i)
-            bar = f"{CYAN}[{'█' * filled}{' ' * (bar_length - filled)}] {percentage:.0f}%{RESET}"
-            print(f"{YELLOW}Loading...{RESET}")
-            print(bar)
+            # Carriage return redraws the bar in place instead of clearing the whole screen
+            sys.stdout.write(f"\r{CYAN}[{'█' * filled}{' ' * (bar_length - filled)}] {percentage:.0f}%{RESET}")
             sys.stdout.flush()
             time.sleep(0.05)
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear_screen()
+
+    def browse_tasks(self):
+        page = 1
+        while True:
+            self.display_tasks(page)
+            nav = _prompt(f"{YELLOW}Navigate (p=prev, n=next, d=details, q=quit): {RESET}")
+            if nav == "p" and page > 1:
+                page -= 1
+            elif nav == "n" and page * 5 < len(self.current_user.tasks):
+                page += 1
+            elif nav == "d":
+                task_id = _prompt(f"{YELLOW}Enter task ID for details: {RESET}")
+                task = self.current_user.tasks.get(task_id)
+                if task:
+                    print(f"{CYAN}Details for {task.title}: {self._render_markdown(task.description)}{RESET}")
+                    _prompt(f"{YELLOW}Press Enter to continue...{RESET}")
+            elif nav == "q":
+                break
+            else:
+                print(f"{RED}Invalid navigation.{RESET}")
+        input(f"{YELLOW}Press Enter to continue...{RESET}")
+        _clear_screen()
 
     def set_avatar(self):
         print(f"{GREEN}Selected: Set Avatar{RESET}")
         avatar = input(f"{YELLOW}Enter your ASCII avatar (e.g., ':-)' or '🐱'): {RESET}").strip()
         self.current_user.avatar = avatar
-        self._save_users()
+        self._log_user()
         print(f"{GREEN}Avatar set to: {avatar}{RESET}")
         input(f"{YELLOW}Press Enter to continue...{RESET}")
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear_screen()
 
     def team_shoutout(self):
         print(f"{GREEN}Selected: Team Shoutout{RESET}")
-        message = input(f"{YELLOW}Enter shoutout message: {RESET}")
-        shoutout_art = f"{MAGENTA}🎉 {message} 🎉\n" \
-                       f"{MAGENTA} .-""""""""-.\n" \
-                       f": ,  👥  , :\n" \
-                       f": ,______ , :\n" \
-                       f" `._      _.'{RESET}"
-        print(shoutout_art)
+        message = _prompt(f"{YELLOW}Enter shoutout message: {RESET}")
+        print(SHOUTOUT_TEMPLATE.format(message=message))
         input(f"{YELLOW}Press Enter to continue...{RESET}")
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear_screen()
 
     def sync_cloud(self):
         print(f"{GREEN}Selected: Sync with Cloud{RESET}")
-        action = input(f"{YELLOW}Sync to cloud (t) or from cloud (f)? (t/f): {RESET}").lower()
+        action = _prompt(f"{YELLOW}Sync to cloud (t) or from cloud (f)? (t/f): {RESET}").lower()
         if action == "t":
             self._save_cloud_tasks()
             print(f"{GREEN}Tasks synced to cloud!{RESET}")
@@ -609,25 +1015,26 @@ class TaskManager:
         else:
             print(f"{RED}Invalid choice. Use 't' or 'f'.{RESET}")
         input(f"{YELLOW}Press Enter to continue...{RESET}")
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear_screen()
 
     def check_milestones(self):
         print(f"{GREEN}Selected: Check Milestones{RESET}")
         print(f"{CYAN}Current Points: {self.current_user.points}{RESET}")
-        if self.current_user.points >= 50:
-            self._show_milestone()
-        else:
-            print(f"{YELLOW}Keep going! Need {50 - self.current_user.points} more points for the next milestone!{RESET}")
+        passed = bisect.bisect_right(MILESTONES, self.current_user.points)
+        if passed:
+            self._show_milestone(MILESTONES[passed - 1])
+        if passed < len(MILESTONES):
+            print(f"{YELLOW}Keep going! Need {MILESTONES[passed] - self.current_user.points} more points for the next milestone!{RESET}")
 
         while True:
-            action = input(f"{YELLOW}Press 'h' for help on milestones, or Enter to exit: {RESET}").lower()
+            action = _prompt(f"{YELLOW}Press 'h' for help on milestones, or Enter to exit: {RESET}").lower()
             if action == "h":
                 self._show_milestone_help()
             elif not action:  # Enter key
                 break
             else:
                 print(f"{RED}Invalid input. Use 'h' or Enter.{RESET}")
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear_screen()
 
     def _show_milestone_help(self):
         print(f"{GREEN}=== Milestone Help ==={RESET}")
@@ -635,39 +1042,62 @@ class TaskManager:
         if self.current_user.milestone_history:
             print(f"{CYAN}Milestone History & Reward Details:{RESET}")
             for entry in self.current_user.milestone_history:
+                # Entries saved before achieved_at_display existed fall back to slicing
+                achieved = entry.get("achieved_at_display") or entry["achieved_at"][:19]
                 if "task_id" in entry:
                     print(f"- Task: {entry['title']} (ID: {entry['task_id']})")
                     print(f"  - Base Points: 10")
                     print(f"  - Priority Bonus: {entry['priority_bonus']} (High priority adds 5){RESET}")
                     print(f"  - Timeliness Bonus: {entry['timeliness_bonus']} (On-time adds 5){RESET}")
-                    print(f"  - Total Points: {entry['points']} (Earned on {entry['achieved_at'][:19]}){RESET}")
+                    print(f"  - Total Points: {entry['points']} (Earned on {achieved}){RESET}")
                 elif "milestone" in entry:
-                    print(f"- Milestone Reached: {entry['milestone']} points on {entry['achieved_at'][:19]}{RESET}")
+                    print(f"- Milestone Reached: {entry['milestone']} points on {achieved}{RESET}")
         else:
             print(f"{YELLOW}No milestones or task completions yet.{RESET}")
         print(f"{CYAN}Reward System:{RESET}")
         print(f"- Base Points: 10 per completed task{RESET}")
         print(f"- Priority Bonus: +5 for high-priority tasks{RESET}")
         print(f"- Timeliness Bonus: +5 if completed on or before due date{RESET}")
-        print(f"{CYAN}Next Milestone: 50 points (triggers celebration!){RESET}")
+        passed = bisect.bisect_right(MILESTONES, self.current_user.points)
+        if passed < len(MILESTONES):
+            print(f"{CYAN}Next Milestone: {MILESTONES[passed]} points (triggers celebration!){RESET}")
+        else:
+            print(f"{CYAN}All milestones reached!{RESET}")
         input(f"{YELLOW}Press Enter to continue...{RESET}")
 
+    def backup_data(self):
+        print(f"{GREEN}Selected: Backup Data{RESET}")
+        self._flush()
+        self._backup()
+        print(f"{GREEN}Backup created!{RESET}")
+        input(f"{YELLOW}Press Enter to continue...{RESET}")
+        _clear_screen()
+
     def show_analytics(self):
         print(f"{GREEN}Selected: Show Analytics{RESET}")
         tasks = self._load_tasks()
         if not tasks:
             print(f"{YELLOW}No tasks available for analysis.{RESET}")
             input(f"{YELLOW}Press Enter to continue...{RESET}")
-            os.system('cls' if os.name == 'nt' else 'clear')
+            _clear_screen()
             return
 
+        now = time.time()
         total_tasks = len(tasks)
-        completed_tasks = sum(1 for t in tasks if t.completed)
+        completed_tasks = overdue_tasks = high_priority_tasks = 0
+        total_effort = total_progress = 0
+        for t in tasks:  # Single pass over the tasks for every statistic
+            if t.completed:
+                completed_tasks += 1
+            elif t.due_ts < now:  # Due dates only matter for open tasks
+                overdue_tasks += 1
+            if t.priority == "high":
+                high_priority_tasks += 1
+            total_effort += t.effort_hours
+            total_progress += t.progress
         completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
-        overdue_tasks = sum(1 for t in tasks if not t.completed and datetime.fromisoformat(t.due_date) < datetime.now())
-        avg_effort_hours = sum(t.effort_hours for t in tasks) / total_tasks if total_tasks > 0 else 0
-        high_priority_tasks = sum(1 for t in tasks if t.priority == "high")
-        avg_progress = sum(t.progress for t in tasks) / total_tasks if total_tasks > 0 else 0
+        avg_effort_hours = total_effort / total_tasks if total_tasks > 0 else 0
+        avg_progress = total_progress / total_tasks if total_tasks > 0 else 0
 
         print(f"{CYAN}=== Task Analytics ==={RESET}")
         print(f"{CYAN}Total Tasks: {total_tasks}{RESET}")
@@ -677,130 +1107,82 @@ class TaskManager:
         print(f"{MAGENTA}High Priority Tasks: {high_priority_tasks} ({high_priority_tasks/total_tasks*100:.1f}%) {RESET}")
         print(f"{YELLOW}Average Progress: {avg_progress:.1f}%{RESET}")
         input(f"{YELLOW}Press Enter to continue...{RESET}")
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear_screen()
+
+    def _reschedule_recurring(self):
+        # Nothing can become due for rescheduling before the earliest completed recurring task's due date
+        if time.time() < self._next_recur_check_ts:
+            return
+        now = time.time()
+        next_check = float("inf")
+        for task_id in list(self._recurring_ids):
+            task = self.current_user.tasks.get(task_id)
+            if task is None or task.recurring == "none":
+                self._recurring_ids.discard(task_id)
+                continue
+            if not task.completed:
+                continue
+            try:
+                due_ts = task.due_ts
+            except ValueError:
+                continue
+            if now > due_ts:
+                new_task = replace(task, id=uuid.uuid4().hex, completed=False,
+                                   due_date=(_parse_iso(task.due_date) + timedelta(days=1 if task.recurring == "daily" else 7)).isoformat(),
+                                   dependencies=list(task.dependencies))  # Own list, not shared with the original
+                self.current_user.tasks[new_task.id] = new_task
+                task.completed = False
+                self._log_task(new_task)
+                self._log_task(task)
+            else:
+                next_check = min(next_check, due_ts)
+        self._next_recur_check_ts = next_check
 
     def run(self):
         tasks = self._load_tasks()
-        last_input_time = time.time()
-        queue = Queue()
+        # select() only sees what is still in the terminal, not lines input() has already buffered
+        # (piped input), and the animation needs a real screen, so idling is for interactive sessions only
+        idle_timeout = IDLE_TIMEOUT if sys.stdin.isatty() and sys.stdout.isatty() else None
         notify_thread = threading.Thread(target=self.notify_tasks, daemon=True)
         notify_thread.start()
 
+        self._flush()  # Fold changes replayed from the journal into users.json so the backup pair agrees
+        self._backup()  # One backup per session instead of one per save
         self.loading_screen()
         self.animated_header()
-        while True:
-            os.system('cls' if os.name == 'nt' else 'clear')
-            print(f"{RED}╔════════════════════════════════════════════╗{RESET}")
-            print(f"{RED}║    {YELLOW}ADVANCED TASK MANAGER CLI v{self.version}{RESET}    {RED}║{RESET}")
-            print(f"{RED}╠════════════════════════════════════════════╣{RESET}")
-            print(f"{RED}║ {CYAN}Efficient. Organized. Productive.{RESET} {RED}║{RESET}")
-            print(f"{RED}╚════════════════════════════════════════════╝{RESET}")
-            print(f"{BLUE}1. Add Task{RESET}")
-            print(f"{BLUE}2. Edit Task{RESET}")
-            print(f"{BLUE}3. Delete Task{RESET}")
-            print(f"{BLUE}4. Undo Delete{RESET}")
-            print(f"{BLUE}5. Toggle Completion{RESET}")
-            print(f"{BLUE}6. Filter Tasks{RESET}")
-            # Commented out Sort Tasks
-            # print(f"{BLUE}7. Sort Tasks{RESET}")
-            print(f"{BLUE}7. Search Tasks{RESET}")
-            print(f"{BLUE}8. Export Tasks{RESET}")
-            print(f"{BLUE}9. Import Tasks{RESET}")
-            print(f"{BLUE}10. Show Dashboard{RESET}")
-            print(f"{BLUE}11. Manage Categories{RESET}")
-            print(f"{BLUE}12. Display All Tasks{RESET}")
-            print(f"{BLUE}13. Set Avatar{RESET}")
-            print(f"{BLUE}14. Team Shoutout{RESET}")
-            print(f"{BLUE}15. Sync with Cloud{RESET}")
-            print(f"{BLUE}16. Check Milestones{RESET}")
-            print(f"{BLUE}17. Show Analytics{RESET}")
-            print(f"{BLUE}18. Exit{RESET}")
-
-            while not queue.empty():
-                print(self.notification_queue.get())
-
-            if time.time() - last_input_time > 15:
-                self.idle_animation(last_input_time, queue)
-
-            choice = input(f"{YELLOW}Enter your choice (1-18): {RESET}")
-            last_input_time = time.time()
-
-            if choice == "1":
-                self.add_task()
-            elif choice == "2":
-                self.edit_task()
-            elif choice == "3":
-                self.delete_task()
-            elif choice == "4":
-                self.undo_delete()
-            elif choice == "5":
-                self.toggle_complete()
-            elif choice == "6":
-                self.filter_tasks()
-            # Commented out Sort Tasks logic
-            # elif choice == "7":
-            #     self.sort_tasks()
-            elif choice == "7":
-                self.search_tasks()
-            elif choice == "8":
-                self.export_tasks()
-            elif choice == "9":
-                self.import_tasks()
-            elif choice == "10":
-                self.show_dashboard()
-            elif choice == "11":
-                self.manage_categories()
-            elif choice == "12":
-                page = 1
-                while True:
-                    self.display_tasks(page)
-                    nav = input(f"{YELLOW}Navigate (p=prev, n=next, d=details, q=quit): {RESET}")
-                    if nav == "p" and page > 1:
-                        page -= 1
-                    elif nav == "n" and page * 5 < len(self.current_user.tasks):
-                        page += 1
-                    elif nav == "d":
-                        task_id = input(f"{YELLOW}Enter task ID for details: {RESET}")
-                        task = next((t for t in self.current_user.tasks if t.id == task_id), None)
-                        if task:
-                            print(f"{CYAN}Details for {task.title}: {self._render_markdown(task.description)}{RESET}")
-                            input(f"{YELLOW}Press Enter to continue...{RESET}")
-                    elif nav == "q":
-                        break
-                    else:
-                        print(f"{RED}Invalid navigation.{RESET}")
-                input(f"{YELLOW}Press Enter to continue...{RESET}")
-                os.system('cls' if os.name == 'nt' else 'clear')
-            elif choice == "13":
-                self.set_avatar()
-            elif choice == "14":
-                self.team_shoutout()
-            elif choice == "15":
-                self.sync_cloud()
-            elif choice == "16":
-                self.check_milestones()
-            elif choice == "17":
-                self.show_analytics()
-            elif choice == "18":
-                print(f"{GREEN}Selected: Exit{RESET}")
-                print(f"{YELLOW}Exiting...{RESET}")
-                break
-            else:
-                print(f"{RED}Invalid choice. Please try again.{RESET}")
-                time.sleep(1)
-
-            changed = False
-            for task in [t for t in self.current_user.tasks if t.recurring != "none"]:
-                if task.completed and datetime.now() > datetime.fromisoformat(task.due_date):
-                    new_task = Task(**vars(task))
-                    new_task.id = str(uuid.uuid4())
-                    new_task.completed = False
-                    new_task.due_date = (datetime.fromisoformat(task.due_date) + timedelta(days=1 if task.recurring == "daily" else 7)).isoformat()
-                    self.current_user.tasks.append(new_task)
-                    task.completed = False
-                    changed = True
-            if changed:
-                self._save_tasks()
+        try:
+            while True:
+                sys.stdout.flush()  # Anything still in the text layer goes out before the raw frame
+                sys.stdout.buffer.write(self._menu_frame)
+                sys.stdout.buffer.flush()
+
+                if self._notify_pending.is_set():
+                    self._notify_pending.clear()  # Cleared before draining so a message queued meanwhile re-sets it
+                    messages = []
+                    while self.notification_queue:
+                        messages.append(self.notification_queue.popleft())
+                    if messages:
+                        sys.stdout.write("\n".join(messages) + "\n")
+
+                choice = _prompt(f"{YELLOW}Enter your choice (1-19): {RESET}", timeout=idle_timeout)
+                if choice is None:
+                    self.idle_animation()
+                    continue  # Redraw the menu, with any notification that ended the animation
+
+                action = self._dispatch.get(choice)
+                if action:
+                    action()
+                elif choice == "19":
+                    print(f"{GREEN}Selected: Exit{RESET}")
+                    print(f"{YELLOW}Exiting...{RESET}")
+                    break
+                else:
+                    print(f"{RED}Invalid choice. Please try again.{RESET}")
+                    time.sleep(1)
+
+                self._reschedule_recurring()
+        finally:
+            self._flush()  # Also persist pending changes on Ctrl+C or an unexpected error
 
 if __name__ == "__main__":
     manager = TaskManager()